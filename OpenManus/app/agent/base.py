@@ -172,18 +172,21 @@ class BaseAgent(BaseModel, ABC):
         if len(self.memory.messages) < 2:
             return False
 
-        last_message = self.memory.messages[-1]
-        if not last_message.content:
+        messages = self.memory.messages
+        last_content = messages[-1].content
+        if not last_content:
             return False
 
-        # Count identical content occurrences
-        duplicate_count = sum(
-            1
-            for msg in reversed(self.memory.messages[:-1])
-            if msg.role == "assistant" and msg.content == last_message.content
-        )
+        # Count identical content occurrences, stopping once the threshold is hit
+        duplicate_count = 0
+        for i in range(len(messages) - 2, -1, -1):
+            msg = messages[i]
+            if msg.role == "assistant" and msg.content == last_content:
+                duplicate_count += 1
+                if duplicate_count >= self.duplicate_threshold:
+                    return True
 
-        return duplicate_count >= self.duplicate_threshold
+        return False
 
     @property
     def messages(self) -> List[Message]:
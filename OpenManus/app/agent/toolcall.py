@@ -11,7 +11,6 @@ from app.prompt.toolcall import NEXT_STEP_PROMPT, SYSTEM_PROMPT
 from app.schema import TOOL_CHOICE_TYPE, AgentState, Message, ToolCall, ToolChoice
 from app.tool import CreateChatCompletion, Terminate, ToolCollection
 
-
 TOOL_CALL_REQUIRED = "Tool calls required but none provided"
 
 
@@ -137,14 +136,14 @@ class ToolCallAgent(ReActAgent):
             # Return last message content if no tool calls
             return self.messages[-1].content or "No content or commands to execute"
 
-        results = []
-        for command in self.tool_calls:
+        results: List[str] = [""] * len(self.tool_calls)
+        for i, command in enumerate(self.tool_calls):
             # Reset base64_image for each tool call
             self._current_base64_image = None
 
             result = await self.execute_tool(command)
 
-            if self.max_observe:
+            if self.max_observe and len(result) > self.max_observe:
                 result = result[: self.max_observe]
 
             logger.info(
@@ -159,7 +158,7 @@ class ToolCallAgent(ReActAgent):
                 base64_image=self._current_base64_image,
             )
             self.memory.add_message(tool_msg)
-            results.append(result)
+            results[i] = result
 
         return "\n\n".join(results)
 
@@ -47,7 +47,7 @@ class SearchSettings(BaseModel):
     )
     retry_delay: int = Field(
         default=60,
-        description="Seconds to wait before retrying all engines again after they all fail",
+        description="Maximum seconds to wait before retrying all engines again after they all fail; earlier retries back off exponentially below it",
     )
     max_retries: int = Field(
         default=3,
@@ -1,7 +1,9 @@
+import itertools
 import json
+import re
 import time
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, FrozenSet, List, Optional, Union
 
 from pydantic import Field
 
@@ -13,6 +15,13 @@ from app.schema import AgentState, Message, ToolChoice
 from app.tool import PlanningTool
 
 
+# Matches step type tags such as [SEARCH] or [CODE] in plan step text
+_STEP_TYPE_PATTERN = re.compile(r"\[([A-Z_]+)\]")
+
+# Process-wide sequence that keeps plan IDs unique within the same second
+_plan_sequence = itertools.count(1)
+
+
 class PlanStepStatus(str, Enum):
     """Enum class defining possible statuses of a plan step"""
 
@@ -27,9 +36,9 @@ class PlanStepStatus(str, Enum):
         return [status.value for status in cls]
 
     @classmethod
-    def get_active_statuses(cls) -> list[str]:
-        """Return a list of values representing active statuses (not started or in progress)"""
-        return [cls.NOT_STARTED.value, cls.IN_PROGRESS.value]
+    def get_active_statuses(cls) -> FrozenSet[str]:
+        """Return the set of values representing active statuses (not started or in progress)"""
+        return _ACTIVE_STEP_STATUSES
 
     @classmethod
     def get_status_marks(cls) -> Dict[str, str]:
@@ -42,13 +51,20 @@ class PlanStepStatus(str, Enum):
         }
 
 
+_ACTIVE_STEP_STATUSES = frozenset(
+    {PlanStepStatus.NOT_STARTED.value, PlanStepStatus.IN_PROGRESS.value}
+)
+
+
 class PlanningFlow(BaseFlow):
     """A flow that manages planning and execution of tasks using agents."""
 
     llm: LLM = Field(default_factory=lambda: LLM())
     planning_tool: PlanningTool = Field(default_factory=PlanningTool)
     executor_keys: List[str] = Field(default_factory=list)
-    active_plan_id: str = Field(default_factory=lambda: f"plan_{int(time.time())}")
+    active_plan_id: str = Field(
+        default_factory=lambda: f"plan_{int(time.time())}_{next(_plan_sequence)}"
+    )
     current_step_index: Optional[int] = None
 
     def __init__(
@@ -229,20 +245,19 @@ class PlanningFlow(BaseFlow):
             step_statuses = plan_data.get("step_statuses", [])
 
             # Find first non-completed step
+            active_statuses = PlanStepStatus.get_active_statuses()
             for i, step in enumerate(steps):
                 if i >= len(step_statuses):
                     status = PlanStepStatus.NOT_STARTED.value
                 else:
                     status = step_statuses[i]
 
-                if status in PlanStepStatus.get_active_statuses():
+                if status in active_statuses:
                     # Extract step type/category if available
                     step_info = {"text": step}
 
                     # Try to extract step type from the text (e.g., [SEARCH] or [CODE])
-                    import re
-
-                    type_match = re.search(r"\[([A-Z_]+)\]", step)
+                    type_match = _STEP_TYPE_PATTERN.search(step)
                     if type_match:
                         step_info["type"] = type_match.group(1).lower()
 
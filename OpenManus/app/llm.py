@@ -1,5 +1,7 @@
+import hashlib
 import math
-from typing import Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
 
 import tiktoken
 from openai import (
@@ -31,15 +33,17 @@ from app.schema import (
 )
 
 
-REASONING_MODELS = ["o1", "o3-mini"]
-MULTIMODAL_MODELS = [
-    "gpt-4-vision-preview",
-    "gpt-4o",
-    "gpt-4o-mini",
-    "claude-3-opus-20240229",
-    "claude-3-sonnet-20240229",
-    "claude-3-haiku-20240307",
-]
+REASONING_MODELS = frozenset({"o1", "o3-mini"})
+MULTIMODAL_MODELS = frozenset(
+    {
+        "gpt-4-vision-preview",
+        "gpt-4o",
+        "gpt-4o-mini",
+        "claude-3-opus-20240229",
+        "claude-3-sonnet-20240229",
+        "claude-3-haiku-20240307",
+    }
+)
 
 
 class TokenCounter:
@@ -54,12 +58,39 @@ class TokenCounter:
     HIGH_DETAIL_TARGET_SHORT_SIDE = 768
     TILE_SIZE = 512
 
+    # Maximum number of text token counts kept in the LRU cache
+    TEXT_CACHE_SIZE = 4096
+    # Texts shorter than this (roles, names, tool call ids) are cheaper to
+    # encode than to cache, and would otherwise crowd out message contents
+    MIN_CACHED_TEXT_LEN = 64
+
     def __init__(self, tokenizer):
         self.tokenizer = tokenizer
+        # The whole conversation is re-counted before every request, so
+        # cache per-text counts instead of re-encoding unchanged history.
+        # Keys are digests so the cache never keeps message bodies alive.
+        self._text_cache: "OrderedDict[bytes, int]" = OrderedDict()
 
     def count_text(self, text: str) -> int:
         """Calculate tokens for a text string"""
-        return 0 if not text else len(self.tokenizer.encode(text))
+        if not text:
+            return 0
+        if len(text) < self.MIN_CACHED_TEXT_LEN:
+            return len(self.tokenizer.encode(text))
+
+        key = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            self._text_cache.move_to_end(key)
+            return cached
+
+        count = len(self.tokenizer.encode(text))
+        self._text_cache[key] = count
+        if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return count
 
     def count_image(self, image_item: dict) -> int:
         """
@@ -225,6 +256,8 @@ class LLM:
                 self.client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
 
             self.token_counter = TokenCounter(self.tokenizer)
+            # (tools list, token count) for the last tool schema list seen
+            self._tools_tokens_cache: Optional[Tuple[List[dict], int]] = None
 
     def count_tokens(self, text: str) -> int:
         """Calculate the number of tokens in a text"""
@@ -235,6 +268,23 @@ class LLM:
     def count_message_tokens(self, messages: List[dict]) -> int:
         return self.token_counter.count_message_tokens(messages)
 
+    def _count_tools_tokens(self, tools: Optional[List[dict]]) -> int:
+        """Calculate tokens for tool descriptions, reusing the last result.
+
+        ToolCollection.to_params returns the same list object until the tools
+        change, so identity is enough to detect an unchanged schema list.
+        This relies on callers never mutating that list in place; anyone who
+        needs to add or edit schemas must pass a copy instead.
+        """
+        if not tools:
+            return 0
+        cached = self._tools_tokens_cache
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+        tools_tokens = sum(self.count_tokens(str(tool)) for tool in tools)
+        self._tools_tokens_cache = (tools, tools_tokens)
+        return tools_tokens
+
     def update_token_count(self, input_tokens: int, completion_tokens: int = 0) -> None:
         """Update token counts"""
         # Only track tokens if max_input_tokens is set
@@ -438,15 +488,14 @@ class LLM:
             response = await self.client.chat.completions.create(**params, stream=True)
 
             collected_messages = []
-            completion_text = ""
             async for chunk in response:
                 chunk_message = chunk.choices[0].delta.content or ""
                 collected_messages.append(chunk_message)
-                completion_text += chunk_message
                 print(chunk_message, end="", flush=True)
 
             print()  # Newline after streaming
-            full_response = "".join(collected_messages).strip()
+            completion_text = "".join(collected_messages)
+            full_response = completion_text.strip()
             if not full_response:
                 raise ValueError("Empty response from streaming LLM")
 
@@ -517,7 +566,7 @@ class LLM:
             # this method should only be called with models that support images
             if self.model not in MULTIMODAL_MODELS:
                 raise ValueError(
-                    f"Model {self.model} does not support images. Use a model from {MULTIMODAL_MODELS}"
+                    f"Model {self.model} does not support images. Use a model from {sorted(MULTIMODAL_MODELS)}"
                 )
 
             # Format messages with image support
@@ -691,12 +740,7 @@ class LLM:
             input_tokens = self.count_message_tokens(messages)
 
             # If there are tools, calculate token count for tool descriptions
-            tools_tokens = 0
-            if tools:
-                for tool in tools:
-                    tools_tokens += self.count_tokens(str(tool))
-
-            input_tokens += tools_tokens
+            input_tokens += self._count_tools_tokens(tools)
 
             # Check if token limits are exceeded
             if not self.check_token_limit(input_tokens):
@@ -21,6 +21,17 @@ from app.tool.str_replace_editor import StrReplaceEditor
 from app.tool.terminate import Terminate
 
 
+# Map JSON Schema types to Python annotations
+_JSON_SCHEMA_TYPES: Dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
+
 class MCPServer:
     """MCP Server implementation with tool registration and management."""
 
@@ -48,8 +59,8 @@ class MCPServer:
             logger.info(f"Result of {tool_name}: {result}")
 
             # Handle different types of results (match original logic)
-            if hasattr(result, "model_dump"):
-                return json.dumps(result.model_dump())
+            if hasattr(result, "model_dump_json"):
+                return result.model_dump_json()
             elif isinstance(result, dict):
                 return json.dumps(result)
             return result
@@ -61,7 +72,9 @@ class MCPServer:
 
         # Store parameter schema (important for tools that access it programmatically)
         param_props = tool_function.get("parameters", {}).get("properties", {})
-        required_params = tool_function.get("parameters", {}).get("required", [])
+        required_params = frozenset(
+            tool_function.get("parameters", {}).get("required", [])
+        )
         tool_method._parameter_schema = {
             param_name: {
                 "description": param_details.get("description", ""),
@@ -79,7 +92,9 @@ class MCPServer:
         """Build a formatted docstring from tool function metadata."""
         description = tool_function.get("description", "")
         param_props = tool_function.get("parameters", {}).get("properties", {})
-        required_params = tool_function.get("parameters", {}).get("required", [])
+        required_params = frozenset(
+            tool_function.get("parameters", {}).get("required", [])
+        )
 
         # Build docstring (match original format)
         docstring = description
@@ -100,7 +115,9 @@ class MCPServer:
     def _build_signature(self, tool_function: dict) -> Signature:
         """Build a function signature from tool function metadata."""
         param_props = tool_function.get("parameters", {}).get("properties", {})
-        required_params = tool_function.get("parameters", {}).get("required", [])
+        required_params = frozenset(
+            tool_function.get("parameters", {}).get("required", [])
+        )
 
         parameters = []
 
@@ -110,19 +127,11 @@ class MCPServer:
             default = Parameter.empty if param_name in required_params else None
 
             # Map JSON Schema types to Python types (same as original)
-            annotation = Any
-            if param_type == "string":
-                annotation = str
-            elif param_type == "integer":
-                annotation = int
-            elif param_type == "number":
-                annotation = float
-            elif param_type == "boolean":
-                annotation = bool
-            elif param_type == "object":
-                annotation = dict
-            elif param_type == "array":
-                annotation = list
+            annotation = (
+                _JSON_SCHEMA_TYPES.get(param_type, Any)
+                if isinstance(param_type, str)
+                else Any
+            )
 
             # Create parameter with same structure as original
             param = Parameter(
@@ -1,9 +1,9 @@
 import asyncio
 import io
 import os
+import secrets
 import tarfile
 import tempfile
-import uuid
 from typing import Dict, Optional
 
 import docker
@@ -67,7 +67,7 @@ class DockerSandbox:
             )
 
             # Generate unique container name with sandbox_ prefix
-            container_name = f"sandbox_{uuid.uuid4().hex[:8]}"
+            container_name = f"sandbox_{secrets.token_hex(4)}"
 
             # Create container
             container = await asyncio.to_thread(
@@ -52,7 +52,11 @@ class ToolCall(BaseModel):
 
 
 class Message(BaseModel):
-    """Represents a chat message in the conversation"""
+    """Represents a chat message in the conversation
+
+    The user/system/tool factories are built on every agent step from values
+    the framework already controls, so they skip validation via model_construct.
+    """
 
     role: ROLE_TYPE = Field(...)  # type: ignore
     content: Optional[str] = Field(default=None)
@@ -87,7 +91,19 @@ class Message(BaseModel):
         if self.content is not None:
             message["content"] = self.content
         if self.tool_calls is not None:
-            message["tool_calls"] = [tool_call.dict() for tool_call in self.tool_calls]
+            # Shape tool calls directly rather than going through the generic
+            # model serializer; this runs for every message on every LLM request
+            message["tool_calls"] = [
+                {
+                    "id": tool_call.id,
+                    "type": tool_call.type,
+                    "function": {
+                        "name": tool_call.function.name,
+                        "arguments": tool_call.function.arguments,
+                    },
+                }
+                for tool_call in self.tool_calls
+            ]
         if self.name is not None:
             message["name"] = self.name
         if self.tool_call_id is not None:
@@ -101,12 +117,14 @@ class Message(BaseModel):
         cls, content: str, base64_image: Optional[str] = None
     ) -> "Message":
         """Create a user message"""
-        return cls(role=Role.USER, content=content, base64_image=base64_image)
+        return cls.model_construct(
+            role=Role.USER.value, content=content, base64_image=base64_image
+        )
 
     @classmethod
     def system_message(cls, content: str) -> "Message":
         """Create a system message"""
-        return cls(role=Role.SYSTEM, content=content)
+        return cls.model_construct(role=Role.SYSTEM.value, content=content)
 
     @classmethod
     def assistant_message(
@@ -120,8 +138,8 @@ class Message(BaseModel):
         cls, content: str, name, tool_call_id: str, base64_image: Optional[str] = None
     ) -> "Message":
         """Create a tool message"""
-        return cls(
-            role=Role.TOOL,
+        return cls.model_construct(
+            role=Role.TOOL.value,
             content=content,
             name=name,
             tool_call_id=tool_call_id,
@@ -164,15 +182,19 @@ class Memory(BaseModel):
         """Add a message to memory"""
         self.messages.append(message)
         # Optional: Implement message limit
-        if len(self.messages) > self.max_messages:
-            self.messages = self.messages[-self.max_messages :]
+        self._trim()
 
     def add_messages(self, messages: List[Message]) -> None:
         """Add multiple messages to memory"""
         self.messages.extend(messages)
         # Optional: Implement message limit
-        if len(self.messages) > self.max_messages:
-            self.messages = self.messages[-self.max_messages :]
+        self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest messages in place once max_messages is exceeded"""
+        excess = len(self.messages) - self.max_messages
+        if excess > 0:
+            del self.messages[:excess]
 
     def clear(self) -> None:
         """Clear all messages"""
@@ -47,7 +47,7 @@ class ToolResult(BaseModel):
         arbitrary_types_allowed = True
 
     def __bool__(self):
-        return any(getattr(self, field) for field in self.__fields__)
+        return any(getattr(self, field) for field in type(self).model_fields)
 
     def __add__(self, other: "ToolResult"):
         def combine_fields(
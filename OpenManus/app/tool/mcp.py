@@ -1,3 +1,4 @@
+import re
 from contextlib import AsyncExitStack
 from typing import Dict, List, Optional
 
@@ -11,6 +12,10 @@ from app.tool.base import BaseTool, ToolResult
 from app.tool.tool_collection import ToolCollection
 
 
+_INVALID_TOOL_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+_REPEATED_UNDERSCORES = re.compile(r"_+")
+
+
 class MCPClientTool(BaseTool):
     """Represents a tool proxy that can be called on the MCP server from the client side."""
 
@@ -127,13 +132,11 @@ class MCPClients(ToolCollection):
 
     def _sanitize_tool_name(self, name: str) -> str:
         """Sanitize tool name to match MCPClientTool requirements."""
-        import re
-
         # Replace invalid characters with underscores
-        sanitized = re.sub(r"[^a-zA-Z0-9_-]", "_", name)
+        sanitized = _INVALID_TOOL_NAME_CHARS.sub("_", name)
 
         # Remove consecutive underscores
-        sanitized = re.sub(r"_+", "_", sanitized)
+        sanitized = _REPEATED_UNDERSCORES.sub("_", sanitized)
 
         # Remove leading/trailing underscores
         sanitized = sanitized.strip("_")
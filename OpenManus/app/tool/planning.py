@@ -1,4 +1,5 @@
 # tool/planning.py
+from collections import Counter
 from typing import Dict, List, Literal, Optional
 
 from app.exceptions import ToolError
@@ -10,6 +11,13 @@ A planning tool that allows the agent to create and manage plans for solving com
 The tool provides functionality for creating plans, updating plan steps, and tracking progress.
 """
 
+_STEP_STATUS_SYMBOLS = {
+    "not_started": "[ ]",
+    "in_progress": "[→]",
+    "completed": "[✓]",
+    "blocked": "[!]",
+}
+
 
 class PlanningTool(BaseTool):
     """
@@ -283,12 +291,7 @@ class PlanningTool(BaseTool):
                 f"Invalid step_index: {step_index}. Valid indices range from 0 to {len(plan['steps'])-1}."
             )
 
-        if step_status and step_status not in [
-            "not_started",
-            "in_progress",
-            "completed",
-            "blocked",
-        ]:
+        if step_status and step_status not in _STEP_STATUS_SYMBOLS:
             raise ToolError(
                 f"Invalid step_status: {step_status}. Valid statuses are: not_started, in_progress, completed, blocked"
             )
@@ -321,43 +324,34 @@ class PlanningTool(BaseTool):
 
     def _format_plan(self, plan: Dict) -> str:
         """Format a plan for display."""
-        output = f"Plan: {plan['title']} (ID: {plan['plan_id']})\n"
-        output += "=" * len(output) + "\n\n"
+        header = f"Plan: {plan['title']} (ID: {plan['plan_id']})\n"
+        lines = [header, "=" * len(header), "\n\n"]
 
-        # Calculate progress statistics
+        # Calculate progress statistics in a single pass
         total_steps = len(plan["steps"])
-        completed = sum(1 for status in plan["step_statuses"] if status == "completed")
-        in_progress = sum(
-            1 for status in plan["step_statuses"] if status == "in_progress"
-        )
-        blocked = sum(1 for status in plan["step_statuses"] if status == "blocked")
-        not_started = sum(
-            1 for status in plan["step_statuses"] if status == "not_started"
-        )
+        counts = Counter(plan["step_statuses"])
+        completed = counts["completed"]
 
-        output += f"Progress: {completed}/{total_steps} steps completed "
+        lines.append(f"Progress: {completed}/{total_steps} steps completed ")
         if total_steps > 0:
             percentage = (completed / total_steps) * 100
-            output += f"({percentage:.1f}%)\n"
+            lines.append(f"({percentage:.1f}%)\n")
         else:
-            output += "(0%)\n"
+            lines.append("(0%)\n")
 
-        output += f"Status: {completed} completed, {in_progress} in progress, {blocked} blocked, {not_started} not started\n\n"
-        output += "Steps:\n"
+        lines.append(
+            f"Status: {completed} completed, {counts['in_progress']} in progress, "
+            f"{counts['blocked']} blocked, {counts['not_started']} not started\n\n"
+        )
+        lines.append("Steps:\n")
 
         # Add each step with its status and notes
         for i, (step, status, notes) in enumerate(
             zip(plan["steps"], plan["step_statuses"], plan["step_notes"])
         ):
-            status_symbol = {
-                "not_started": "[ ]",
-                "in_progress": "[→]",
-                "completed": "[✓]",
-                "blocked": "[!]",
-            }.get(status, "[ ]")
-
-            output += f"{i}. {status_symbol} {step}\n"
+            status_symbol = _STEP_STATUS_SYMBOLS.get(status, "[ ]")
+            lines.append(f"{i}. {status_symbol} {step}\n")
             if notes:
-                output += f"   Notes: {notes}\n"
+                lines.append(f"   Notes: {notes}\n")
 
-        return output
+        return "".join(lines)
@@ -1,6 +1,7 @@
 import base64
 import io
 import json
+import re
 import traceback
 from typing import Optional  # Add this import for Optional
 
@@ -16,6 +17,8 @@ from app.tool.base import ToolResult
 from app.utils.logger import logger
 
 
+_BASE64_PATTERN = re.compile(r"^[A-Za-z0-9+/]*={0,2}$")
+
 # Context = TypeVar("Context")
 _BROWSER_DESCRIPTION = """\
 A sandbox-based browser automation tool that allows interaction with web pages through various actions.
@@ -154,9 +157,7 @@ class SandboxBrowserTool(SandboxToolsBase):
                     base64_string = base64_string.split(",", 1)[1]
                 except (IndexError, ValueError):
                     return False, "Invalid data URL format"
-            import re
-
-            if not re.match(r"^[A-Za-z0-9+/]*={0,2}$", base64_string):
+            if not _BASE64_PATTERN.match(base64_string):
                 return False, "Invalid base64 characters detected"
             if len(base64_string) % 4 != 0:
                 return False, "Invalid base64 string length"
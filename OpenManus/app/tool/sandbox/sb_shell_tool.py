@@ -1,5 +1,6 @@
 import asyncio
-import time
+import re
+import secrets
 from typing import Any, Dict, Optional, TypeVar
 from uuid import uuid4
 
@@ -9,6 +10,14 @@ from app.utils.logger import logger
 
 
 Context = TypeVar("Context")
+
+# Prompt/status markers that suggest a blocking command has completed
+_COMPLETION_INDICATORS = re.compile(
+    "|".join(
+        re.escape(indicator)
+        for indicator in ("$", "#", ">", "Done", "Completed", "Finished", "✓")
+    )
+)
 _SHELL_DESCRIPTION = """\
 Execute a shell command in the workspace directory.
 IMPORTANT: Commands are non-blocking by default and run in a tmux session.
@@ -155,7 +164,7 @@ class SandboxShellTool(SandboxToolsBase):
 
             # Generate a session name if not provided
             if not session_name:
-                session_name = f"session_{str(uuid4())[:8]}"
+                session_name = f"session_{secrets.token_hex(4)}"
 
             # Check if tmux session already exists
             check_session = await self._execute_raw_command(
@@ -180,10 +189,11 @@ class SandboxShellTool(SandboxToolsBase):
 
             if blocking:
                 # For blocking execution, wait and capture output
-                start_time = time.time()
-                while (time.time() - start_time) < timeout:
-                    # Wait a bit before checking
-                    time.sleep(2)
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + timeout
+                while loop.time() < deadline:
+                    # Wait a bit before checking without blocking the event loop
+                    await asyncio.sleep(2)
 
                     # Check if session still exists (command might have exited)
                     check_result = await self._execute_raw_command(
@@ -199,21 +209,8 @@ class SandboxShellTool(SandboxToolsBase):
                     current_output = output_result.get("output", "")
 
                     # Check for prompt indicators that suggest command completion
-                    last_lines = current_output.split("\n")[-3:]
-                    completion_indicators = [
-                        "$",
-                        "#",
-                        ">",
-                        "Done",
-                        "Completed",
-                        "Finished",
-                        "✓",
-                    ]
-                    if any(
-                        indicator in line
-                        for indicator in completion_indicators
-                        for line in last_lines
-                    ):
+                    last_lines = current_output.rsplit("\n", 3)[-3:]
+                    if _COMPLETION_INDICATORS.search("\n".join(last_lines)):
                         break
 
                 # Capture final output
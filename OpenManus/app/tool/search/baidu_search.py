@@ -22,12 +22,14 @@ class BaiduSearchEngine(WebSearchEngine):
             if isinstance(item, str):
                 # If it's just a URL
                 results.append(
-                    SearchItem(title=f"Baidu Result {i+1}", url=item, description=None)
+                    SearchItem.model_construct(
+                        title=f"Baidu Result {i+1}", url=item, description=None
+                    )
                 )
             elif isinstance(item, dict):
                 # If it's a dictionary with details
                 results.append(
-                    SearchItem(
+                    SearchItem.model_construct(
                         title=item.get("title", f"Baidu Result {i+1}"),
                         url=item.get("url", ""),
                         description=item.get("abstract", None),
@@ -21,14 +21,14 @@ class DuckDuckGoSearchEngine(WebSearchEngine):
             if isinstance(item, str):
                 # If it's just a URL
                 results.append(
-                    SearchItem(
+                    SearchItem.model_construct(
                         title=f"DuckDuckGo Result {i + 1}", url=item, description=None
                     )
                 )
             elif isinstance(item, dict):
                 # Extract data from the dictionary
                 results.append(
-                    SearchItem(
+                    SearchItem.model_construct(
                         title=item.get("title", f"DuckDuckGo Result {i + 1}"),
                         url=item.get("href", ""),
                         description=item.get("body", None),
@@ -21,11 +21,13 @@ class GoogleSearchEngine(WebSearchEngine):
             if isinstance(item, str):
                 # If it's just a URL
                 results.append(
-                    {"title": f"Google Result {i+1}", "url": item, "description": ""}
+                    SearchItem.model_construct(
+                        title=f"Google Result {i+1}", url=item, description=""
+                    )
                 )
             else:
                 results.append(
-                    SearchItem(
+                    SearchItem.model_construct(
                         title=item.title, url=item.url, description=item.description
                     )
                 )
@@ -1,8 +1,8 @@
 """File and directory manipulation tool with sandbox support."""
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from pathlib import Path
-from typing import Any, DefaultDict, List, Literal, Optional, get_args
+from typing import Any, DefaultDict, Deque, List, Literal, Optional, get_args
 
 from app.config import config
 from app.exceptions import ToolError
@@ -27,6 +27,7 @@ Command = Literal[
 # Constants
 SNIPPET_LINES: int = 4
 MAX_RESPONSE_LEN: int = 16000
+MAX_UNDO_HISTORY: int = 20  # Snapshots kept per file for undo_edit
 TRUNCATED_MESSAGE: str = (
     "<response clipped><NOTE>To save on context only part of this file has been shown to you. "
     "You should retry this tool after you have searched inside the file with `grep -n` "
@@ -98,7 +99,9 @@ class StrReplaceEditor(BaseTool):
         },
         "required": ["command", "path"],
     }
-    _file_history: DefaultDict[PathLike, List[str]] = defaultdict(list)
+    _file_history: DefaultDict[PathLike, Deque[str]] = defaultdict(
+        lambda: deque(maxlen=MAX_UNDO_HISTORY)
+    )
     _local_operator: LocalFileOperator = LocalFileOperator()
     _sandbox_operator: SandboxFileOperator = SandboxFileOperator()
 
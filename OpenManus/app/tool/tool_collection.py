@@ -1,5 +1,6 @@
 """Collection classes for managing multiple tools."""
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Sequence, Tuple
 
 from app.exceptions import ToolError
 from app.logger import logger
@@ -15,12 +16,25 @@ class ToolCollection:
     def __init__(self, *tools: BaseTool):
         self.tools = tools
         self.tool_map = {tool.name: tool for tool in tools}
+        self._params_source = None
+        self._params: List[Dict[str, Any]] = []
 
     def __iter__(self):
         return iter(self.tools)
 
     def to_params(self) -> List[Dict[str, Any]]:
-        return [tool.to_param() for tool in self.tools]
+        """Return the function-call schemas of all tools.
+
+        The returned list is cached and shared between calls (LLM also keys
+        its tool token count on its identity), so treat it as read-only;
+        callers that need to modify it must take a copy first.
+        """
+        # self.tools is an immutable tuple that is replaced whenever tools are
+        # added or removed, so its identity tells us when to rebuild
+        if self._params_source is not self.tools:
+            self._params = [tool.to_param() for tool in self.tools]
+            self._params_source = self.tools
+        return self._params
 
     async def execute(
         self, *, name: str, tool_input: Dict[str, Any] = None
@@ -34,6 +48,40 @@ class ToolCollection:
         except ToolError as e:
             return ToolFailure(error=e.message)
 
+    async def execute_many(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        max_concurrency: int = 5,
+    ) -> List[ToolResult]:
+        """Execute independent tool calls concurrently.
+
+        Args:
+            calls: (tool name, tool input) pairs.
+            max_concurrency: Maximum number of tools running at the same time.
+
+        Returns:
+            Results in the same order as ``calls``.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+        if not calls:
+            return []
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(name: str, tool_input: Dict[str, Any]) -> ToolResult:
+            async with semaphore:
+                return await self.execute(name=name, tool_input=tool_input)
+
+        return list(
+            await asyncio.gather(*(run(name, tool_input) for name, tool_input in calls))
+        )
+
     async def execute_all(self) -> List[ToolResult]:
         """Execute all tools in the collection sequentially."""
         results = []
@@ -1,4 +1,5 @@
 import asyncio
+import random
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -270,11 +271,14 @@ class WebSearch(BaseTool):
                 )
 
             if retry_count < max_retries:
-                # All engines failed, wait and retry
+                # All engines failed, back off exponentially (capped at retry_delay
+                # for the last attempt) with jitter so concurrent agents spread out
+                backoff = retry_delay * 2 ** (retry_count - max_retries + 1)
+                delay = random.uniform(backoff / 2, backoff)
                 logger.warning(
-                    f"All search engines failed. Waiting {retry_delay} seconds before retry {retry_count + 1}/{max_retries}..."
+                    f"All search engines failed. Waiting {delay:.1f} seconds before retry {retry_count + 1}/{max_retries}..."
                 )
-                await asyncio.sleep(retry_delay)
+                await asyncio.sleep(delay)
             else:
                 logger.error(
                     f"All search engines failed after {max_retries} retries. Giving up."
@@ -0,0 +1,28 @@
+import asyncio
+from typing import Any, Coroutine
+
+
+try:
+    import uvloop
+except ImportError:  # not installed, or unsupported platform (Windows)
+    uvloop = None
+
+
+def configure_loop() -> None:
+    """Tune the running event loop for agent workloads.
+
+    Meant to be called once from a CLI entrypoint's main coroutine. Library
+    code and servers that share their loop (e.g. uvicorn) should not call it.
+    """
+    # Let short-lived tasks (tool calls, MCP requests) finish synchronously
+    # when they never block, instead of paying a loop round-trip (3.12+)
+    loop = asyncio.get_running_loop()
+    if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+
+def run_main(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a CLI entrypoint's main coroutine, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
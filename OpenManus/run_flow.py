@@ -6,9 +6,12 @@ from app.agent.manus import Manus
 from app.config import config
 from app.flow.flow_factory import FlowFactory, FlowType
 from app.logger import logger
+from app.utils.event_loop import configure_loop, run_main
 
 
 async def run_flow():
+    configure_loop()
+
     agents = {
         "manus": Manus(),
     }
@@ -28,12 +31,12 @@ async def run_flow():
         logger.warning("Processing your request...")
 
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = await asyncio.wait_for(
                 flow.execute(prompt),
                 timeout=3600,  # 60 minute timeout for the entire execution
             )
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             logger.info(f"Request processed in {elapsed_time:.2f} seconds")
             logger.info(result)
         except asyncio.TimeoutError:
@@ -49,4 +52,4 @@ async def run_flow():
 
 
 if __name__ == "__main__":
-    asyncio.run(run_flow())
+    run_main(run_flow())
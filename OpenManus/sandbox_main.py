@@ -1,11 +1,13 @@
 import argparse
-import asyncio
 
 from app.agent.sandbox_agent import SandboxManus
 from app.logger import logger
+from app.utils.event_loop import configure_loop, run_main
 
 
 async def main():
+    configure_loop()
+
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Run Manus agent with a prompt")
     parser.add_argument(
@@ -33,4 +35,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_main(main())
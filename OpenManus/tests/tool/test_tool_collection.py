@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from app.tool.base import BaseTool, ToolResult
+from app.tool.tool_collection import ToolCollection
+
+
+class SleepTool(BaseTool):
+    name: str = "sleep"
+    description: str = "Sleep briefly and echo the value back."
+    parameters: dict = {
+        "type": "object",
+        "properties": {"value": {"type": "string"}},
+    }
+    running: int = 0
+    peak: int = 0
+
+    async def execute(self, value: str) -> ToolResult:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return ToolResult(output=value)
+
+
+def test_to_params_is_cached_until_tools_change():
+    collection = ToolCollection(SleepTool())
+
+    params = collection.to_params()
+    assert collection.to_params() is params
+
+    class OtherTool(SleepTool):
+        name: str = "other"
+
+    collection.add_tool(OtherTool())
+    updated = collection.to_params()
+    assert updated is not params
+    assert [p["function"]["name"] for p in updated] == ["sleep", "other"]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_preserves_order_and_bounds_concurrency():
+    tool = SleepTool()
+    collection = ToolCollection(tool)
+
+    calls = [("sleep", {"value": str(i)}) for i in range(6)]
+    results = await collection.execute_many(calls, max_concurrency=2)
+
+    assert [r.output for r in results] == [str(i) for i in range(6)]
+    assert tool.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_many_reports_unknown_tools():
+    collection = ToolCollection(SleepTool())
+
+    results = await collection.execute_many([("missing", {})])
+
+    assert results[0].error == "Tool missing is invalid"
+
+
+@pytest.mark.asyncio
+async def test_execute_many_rejects_non_positive_concurrency():
+    collection = ToolCollection(SleepTool())
+
+    with pytest.raises(ValueError):
+        await collection.execute_many([("sleep", {"value": "x"})], max_concurrency=0)
+
+    assert await collection.execute_many([]) == []
@@ -9,6 +9,15 @@ from openai import OpenAI
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 每次 Embedding API 呼叫最多送出的文字數量
+EMBEDDING_BATCH_SIZE = 100
+
+# 每次 upsert 寫入 Qdrant 的 point 數量
+UPSERT_BATCH_SIZE = 256
+
+# Point ID 命名空間：同一檔案、頁碼與內容永遠得到相同 ID，重複匯入會覆寫而非新增
+POINT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "rag_knowledge_base")
+
 class Indexer:
     def __init__(self):
         # 初始化 Qdrant
@@ -24,9 +33,7 @@ class Indexer:
 
     def _ensure_collection(self):
         """如果集合不存在，則建立新的 (使用預設無名向量)"""
-        try:
-            self.client.get_collection(self.collection_name)
-        except:
+        if not self.client.collection_exists(self.collection_name):
             logger.info(f"🔧 建立新的 Qdrant 集合: {self.collection_name}")
             self.client.create_collection(
                 collection_name=self.collection_name,
@@ -37,12 +44,23 @@ class Indexer:
             )
 
     def get_embedding(self, text: str):
-        text = text.replace("\n", " ")
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts: list):
+        """一次 API 呼叫取得多筆文字的 Embedding (順序與輸入一致)"""
         response = self.openai_client.embeddings.create(
-            input=[text],
+            input=[text.replace("\n", " ") for text in texts],
             model="text-embedding-3-small"
         )
-        return response.data[0].embedding
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+    def _embed_one_by_one(self, docs: list):
+        """逐筆向量化，失敗的文件會被跳過"""
+        for doc in docs:
+            try:
+                yield doc, self.get_embedding(doc["text"])
+            except Exception as e:
+                logger.error(f"❌ 向量化失敗 (跳過): {e}")
 
     def index_documents(self, documents: list):
         """將文件列表寫入 Qdrant"""
@@ -50,36 +68,43 @@ class Indexer:
             return
 
         logger.info(f"💾 [Indexer] 正在將 {len(documents)} 筆資料寫入 Qdrant...")
-        
+
+        docs = [doc for doc in documents if doc.get("text", "").strip()]
+
         points = []
-        for doc in documents:
-            text = doc.get("text", "")
-            if not text.strip():
-                continue
-                
+        # 分批向量化，每批只呼叫一次 Embedding API
+        for start in range(0, len(docs), EMBEDDING_BATCH_SIZE):
+            batch = docs[start:start + EMBEDDING_BATCH_SIZE]
             try:
                 # 生成向量
-                vector = self.get_embedding(text)
-                
+                embedded = zip(batch, self.get_embeddings([doc["text"] for doc in batch]))
+            except Exception as e:
+                # 任一筆過長都會讓整批被拒，改為逐筆處理，只跳過有問題的那一筆
+                logger.warning(f"⚠️ 批次向量化失敗，改為逐筆處理: {e}")
+                embedded = self._embed_one_by_one(batch)
+
+            for doc, vector in embedded:
                 # 準備 Payload
                 payload = {
-                    "text": text,
+                    "text": doc["text"],
                     "file_name": doc.get("metadata", {}).get("file_name", "unknown"),
                     "page_label": doc.get("metadata", {}).get("page_label", "unknown")
                 }
+                point_key = f"{payload['file_name']}\x00{payload['page_label']}\x00{payload['text']}"
 
                 points.append(models.PointStruct(
-                    id=str(uuid.uuid4()),
+                    id=str(uuid.uuid5(POINT_ID_NAMESPACE, point_key)),
                     vector=vector, 
                     payload=payload
                 ))
-            except Exception as e:
-                logger.error(f"❌ 向量化失敗 (跳過): {e}")
 
-        # 批次寫入
-        if points:
+        # 分批寫入：前面的批次不等待索引完成，最後一批 wait=True 確保全部寫入後才回報成功
+        for start in range(0, len(points), UPSERT_BATCH_SIZE):
+            is_last = start + UPSERT_BATCH_SIZE >= len(points)
             self.client.upsert(
                 collection_name=self.collection_name,
-                points=points
+                points=points[start:start + UPSERT_BATCH_SIZE],
+                wait=is_last
             )
+        if points:
             logger.info(f"✅ [Indexer] 寫入成功！")
\ No newline at end of file
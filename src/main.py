@@ -6,6 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from qdrant_client.models import Filter, FieldCondition, MatchValue
 from typing import List, Optional
 import asyncio
 
@@ -228,17 +229,12 @@ async def list_documents():
         raise HTTPException(503, "系統初始化中，請稍後再試")
     
     try:
-        # 從 Qdrant 取得所有唯一的文件名稱
-        from qdrant_client import QdrantClient
-        
-        client = QdrantClient(host="localhost", port=6333)
-        collection_name = "rag_knowledge_base"
+        # 從 Qdrant 取得所有唯一的文件名稱 (共用 retriever 的連線)
+        client = retriever.client
+        collection_name = retriever.collection_name
         
         # 檢查 collection 是否存在
-        collections = client.get_collections().collections
-        collection_names = [c.name for c in collections]
-        
-        if collection_name not in collection_names:
+        if not client.collection_exists(collection_name):
             return []
         
         # 取得 collection 資訊
@@ -288,16 +284,12 @@ async def get_stats():
         raise HTTPException(503, "系統初始化中，請稍後再試")
     
     try:
-        from qdrant_client import QdrantClient
-        
-        client = QdrantClient(host="localhost", port=6333)
-        collection_name = "rag_knowledge_base"
+        # 共用 retriever 的 Qdrant 連線
+        client = retriever.client
+        collection_name = retriever.collection_name
         
         # 檢查 collection 是否存在
-        collections = client.get_collections().collections
-        collection_names = [c.name for c in collections]
-        
-        if collection_name not in collection_names:
+        if not client.collection_exists(collection_name):
             return StatsResponse(
                 document_count=0,
                 total_chunks=0,
@@ -331,11 +323,9 @@ async def delete_document(document_name: str):
         raise HTTPException(503, "系統初始化中，請稍後再試")
     
     try:
-        from qdrant_client import QdrantClient
-        from qdrant_client.models import Filter, FieldCondition, MatchValue
-        
-        client = QdrantClient(host="localhost", port=6333)
-        collection_name = "rag_knowledge_base"
+        # 共用 retriever 的 Qdrant 連線
+        client = retriever.client
+        collection_name = retriever.collection_name
         
         # 刪除該文件的所有向量
         client.delete(
@@ -13,6 +13,7 @@ import os
 import sys
 import asyncio
 import httpx
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -21,13 +22,40 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from mcp.server.fastmcp import FastMCP
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Server 關閉時釋放共用的 HTTP client"""
+    global _http_client
+    try:
+        yield
+    finally:
+        if _http_client is not None:
+            await _http_client.aclose()
+            _http_client = None
+
+
 # 建立 MCP Server
-mcp = FastMCP("rag-server")
+mcp = FastMCP("rag-server", lifespan=_lifespan)
 
 # RAG API 設定
 RAG_API_BASE = os.getenv("RAG_API_BASE", "http://localhost:8001")
 TIMEOUT = 120.0  # 上傳大檔案需要較長時間
 
+# 所有工具共用同一個 HTTP client，重複使用與 RAG API 的連線
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """取得共用的 httpx.AsyncClient (保留連線池，於 Server 關閉時釋放)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=TIMEOUT,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _http_client
+
 
 @mcp.tool()
 async def rag_search(query: str, top_k: int = 5) -> str:
@@ -41,30 +69,30 @@ async def rag_search(query: str, top_k: int = 5) -> str:
     Returns:
         搜尋結果列表，包含相關文件片段
     """
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.post(
-                f"{RAG_API_BASE}/search",
-                json={"query": query, "top_k": top_k}
-            )
-            response.raise_for_status()
-            results = response.json()
+    client = _get_client()
+    try:
+        response = await client.post(
+            f"{RAG_API_BASE}/search",
+            json={"query": query, "top_k": top_k}
+        )
+        response.raise_for_status()
+        results = response.json()
             
-            if not results:
-                return "沒有找到相關結果"
+        if not results:
+            return "沒有找到相關結果"
             
-            # 格式化輸出
-            output = []
-            for i, r in enumerate(results, 1):
-                output.append(f"[{i}] 來源: {r.get('source', 'unknown')} (頁 {r.get('page', '?')})")
-                output.append(f"    相關度: {r.get('score', 0):.3f}")
-                output.append(f"    內容: {r.get('text', '')[:300]}...")
-                output.append("")
+        # 格式化輸出
+        output = []
+        for i, r in enumerate(results, 1):
+            output.append(f"[{i}] 來源: {r.get('source', 'unknown')} (頁 {r.get('page', '?')})")
+            output.append(f"    相關度: {r.get('score', 0):.3f}")
+            output.append(f"    內容: {r.get('text', '')[:300]}...")
+            output.append("")
             
-            return "\n".join(output)
+        return "\n".join(output)
             
-        except httpx.HTTPError as e:
-            return f"搜尋失敗: {str(e)}"
+    except httpx.HTTPError as e:
+        return f"搜尋失敗: {str(e)}"
 
 
 @mcp.tool()
@@ -79,26 +107,26 @@ async def rag_ask(question: str, top_k: int = 5) -> str:
     Returns:
         AI 生成的回答，附帶引用來源
     """
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.post(
-                f"{RAG_API_BASE}/ask",
-                json={"question": question, "top_k": top_k}
-            )
-            response.raise_for_status()
-            result = response.json()
+    client = _get_client()
+    try:
+        response = await client.post(
+            f"{RAG_API_BASE}/ask",
+            json={"question": question, "top_k": top_k}
+        )
+        response.raise_for_status()
+        result = response.json()
             
-            answer = result.get("answer", "無法生成回答")
-            sources = result.get("sources", [])
+        answer = result.get("answer", "無法生成回答")
+        sources = result.get("sources", [])
             
-            output = [answer, "", "📚 參考來源:"]
-            for s in sources:
-                output.append(f"  - {s.get('source', 'unknown')} (頁 {s.get('page', '?')})")
+        output = [answer, "", "📚 參考來源:"]
+        for s in sources:
+            output.append(f"  - {s.get('source', 'unknown')} (頁 {s.get('page', '?')})")
             
-            return "\n".join(output)
+        return "\n".join(output)
             
-        except httpx.HTTPError as e:
-            return f"提問失敗: {str(e)}"
+    except httpx.HTTPError as e:
+        return f"提問失敗: {str(e)}"
 
 
 @mcp.tool()
@@ -120,20 +148,20 @@ async def rag_upload(file_path: str) -> str:
     if not file_path.suffix.lower() == ".pdf":
         return "只支援 PDF 檔案"
     
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            with open(file_path, "rb") as f:
-                files = {"file": (file_path.name, f, "application/pdf")}
-                response = await client.post(
-                    f"{RAG_API_BASE}/upload",
-                    files=files
-                )
-            response.raise_for_status()
-            result = response.json()
-            return f"✅ 上傳成功: {result.get('message', file_path.name)}"
+    client = _get_client()
+    try:
+        with open(file_path, "rb") as f:
+            files = {"file": (file_path.name, f, "application/pdf")}
+            response = await client.post(
+                f"{RAG_API_BASE}/upload",
+                files=files
+            )
+        response.raise_for_status()
+        result = response.json()
+        return f"✅ 上傳成功: {result.get('message', file_path.name)}"
             
-        except httpx.HTTPError as e:
-            return f"上傳失敗: {str(e)}"
+    except httpx.HTTPError as e:
+        return f"上傳失敗: {str(e)}"
 
 
 @mcp.tool()
@@ -165,21 +193,21 @@ async def rag_upload_batch(file_paths: list[str], delay_seconds: float = 2.0) ->
             fail_count += 1
             continue
         
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            try:
-                with open(path, "rb") as f:
-                    files = {"file": (path.name, f, "application/pdf")}
-                    response = await client.post(
-                        f"{RAG_API_BASE}/upload",
-                        files=files
-                    )
-                response.raise_for_status()
-                results.append(f"✅ [{i}/{len(file_paths)}] {path.name}: 上傳成功")
-                success_count += 1
+        client = _get_client()
+        try:
+            with open(path, "rb") as f:
+                files = {"file": (path.name, f, "application/pdf")}
+                response = await client.post(
+                    f"{RAG_API_BASE}/upload",
+                    files=files
+                )
+            response.raise_for_status()
+            results.append(f"✅ [{i}/{len(file_paths)}] {path.name}: 上傳成功")
+            success_count += 1
                 
-            except httpx.HTTPError as e:
-                results.append(f"❌ [{i}/{len(file_paths)}] {path.name}: {str(e)}")
-                fail_count += 1
+        except httpx.HTTPError as e:
+            results.append(f"❌ [{i}/{len(file_paths)}] {path.name}: {str(e)}")
+            fail_count += 1
         
         # 間隔等待，避免過載
         if i < len(file_paths):
@@ -237,27 +265,27 @@ async def rag_list_documents() -> str:
     Returns:
         已索引的文件列表
     """
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.get(f"{RAG_API_BASE}/documents")
-            response.raise_for_status()
-            docs = response.json()
+    client = _get_client()
+    try:
+        response = await client.get(f"{RAG_API_BASE}/documents")
+        response.raise_for_status()
+        docs = response.json()
             
-            if not docs:
-                return "知識庫目前沒有任何文件"
+        if not docs:
+            return "知識庫目前沒有任何文件"
             
-            output = ["📚 已索引的文件:", ""]
-            for i, doc in enumerate(docs, 1):
-                name = doc.get("name", "unknown")
-                chunks = doc.get("chunks", "?")
-                status = doc.get("status", "unknown")
-                output.append(f"  {i}. {name}")
-                output.append(f"     狀態: {status} | 區塊數: {chunks}")
+        output = ["📚 已索引的文件:", ""]
+        for i, doc in enumerate(docs, 1):
+            name = doc.get("name", "unknown")
+            chunks = doc.get("chunks", "?")
+            status = doc.get("status", "unknown")
+            output.append(f"  {i}. {name}")
+            output.append(f"     狀態: {status} | 區塊數: {chunks}")
             
-            return "\n".join(output)
+        return "\n".join(output)
             
-        except httpx.HTTPError as e:
-            return f"取得文件列表失敗: {str(e)}"
+    except httpx.HTTPError as e:
+        return f"取得文件列表失敗: {str(e)}"
 
 
 @mcp.tool()
@@ -268,25 +296,25 @@ async def rag_get_stats() -> str:
     Returns:
         知識庫統計數據
     """
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.get(f"{RAG_API_BASE}/stats")
-            response.raise_for_status()
-            stats = response.json()
+    client = _get_client()
+    try:
+        response = await client.get(f"{RAG_API_BASE}/stats")
+        response.raise_for_status()
+        stats = response.json()
             
-            output = [
-                "📊 知識庫統計",
-                "=" * 30,
-                f"文件數量: {stats.get('document_count', 0)}",
-                f"總區塊數: {stats.get('total_chunks', 0)}",
-                f"向量維度: {stats.get('vector_dim', 'N/A')}",
-                f"索引大小: {stats.get('index_size', 'N/A')}",
-            ]
+        output = [
+            "📊 知識庫統計",
+            "=" * 30,
+            f"文件數量: {stats.get('document_count', 0)}",
+            f"總區塊數: {stats.get('total_chunks', 0)}",
+            f"向量維度: {stats.get('vector_dim', 'N/A')}",
+            f"索引大小: {stats.get('index_size', 'N/A')}",
+        ]
             
-            return "\n".join(output)
+        return "\n".join(output)
             
-        except httpx.HTTPError as e:
-            return f"取得統計資訊失敗: {str(e)}"
+    except httpx.HTTPError as e:
+        return f"取得統計資訊失敗: {str(e)}"
 
 
 @mcp.tool()
@@ -300,20 +328,20 @@ async def rag_delete_document(document_name: str) -> str:
     Returns:
         刪除結果
     """
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.delete(
-                f"{RAG_API_BASE}/documents/{document_name}"
-            )
-            response.raise_for_status()
-            return f"✅ 已刪除文件: {document_name}"
+    client = _get_client()
+    try:
+        response = await client.delete(
+            f"{RAG_API_BASE}/documents/{document_name}"
+        )
+        response.raise_for_status()
+        return f"✅ 已刪除文件: {document_name}"
             
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return f"❌ 找不到文件: {document_name}"
-            return f"❌ 刪除失敗: {str(e)}"
-        except httpx.HTTPError as e:
-            return f"❌ 刪除失敗: {str(e)}"
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return f"❌ 找不到文件: {document_name}"
+        return f"❌ 刪除失敗: {str(e)}"
+    except httpx.HTTPError as e:
+        return f"❌ 刪除失敗: {str(e)}"
 
 
 @mcp.tool()
@@ -327,29 +355,29 @@ async def rag_get_status(file_name: str) -> str:
     Returns:
         文件處理狀態
     """
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.get(f"{RAG_API_BASE}/status/{file_name}")
-            response.raise_for_status()
-            status = response.json()
+    client = _get_client()
+    try:
+        response = await client.get(f"{RAG_API_BASE}/status/{file_name}")
+        response.raise_for_status()
+        status = response.json()
             
-            output = [
-                f"📄 文件: {file_name}",
-                f"狀態: {status.get('status', 'unknown')}",
-                f"進度: {status.get('progress', 0)}%",
-            ]
+        output = [
+            f"📄 文件: {file_name}",
+            f"狀態: {status.get('status', 'unknown')}",
+            f"進度: {status.get('progress', 0)}%",
+        ]
             
-            if status.get('error'):
-                output.append(f"錯誤: {status.get('error')}")
+        if status.get('error'):
+            output.append(f"錯誤: {status.get('error')}")
             
-            return "\n".join(output)
+        return "\n".join(output)
             
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return f"找不到文件: {file_name}"
-            return f"查詢失敗: {str(e)}"
-        except httpx.HTTPError as e:
-            return f"查詢失敗: {str(e)}"
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return f"找不到文件: {file_name}"
+        return f"查詢失敗: {str(e)}"
+    except httpx.HTTPError as e:
+        return f"查詢失敗: {str(e)}"
 
 
 # 啟動 Server
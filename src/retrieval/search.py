@@ -1,11 +1,16 @@
+import hashlib
 import logging
 import os
+from collections import OrderedDict
 from qdrant_client import QdrantClient
 from openai import OpenAI
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 查詢向量快取的最大筆數 (LRU)
+EMBEDDING_CACHE_SIZE = 1024
+
 class HybridRetriever:
     def __init__(self):
         # 回到最簡單的初始化
@@ -15,13 +20,27 @@ class HybridRetriever:
         api_key = os.getenv("OPENAI_API_KEY")
         self.openai_client = OpenAI(api_key=api_key)
 
+        # 以內容雜湊為鍵的查詢向量快取，避免重複查詢再次呼叫 Embedding API
+        self._embedding_cache = OrderedDict()
+
     def get_embedding(self, text: str):
         text = text.replace("\n", " ")
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        cached = self._embedding_cache.get(key)
+        if cached is not None:
+            self._embedding_cache.move_to_end(key)
+            return cached
+
         response = self.openai_client.embeddings.create(
             input=[text],
             model="text-embedding-3-small"
         )
-        return response.data[0].embedding
+        embedding = response.data[0].embedding
+
+        self._embedding_cache[key] = embedding
+        if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+        return embedding
 
     def search(self, query_text: str, top_k: int = 3):
         logger.info(f"🔍 搜尋: {query_text}")